@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import logging
 import pathlib
+import zipfile
 
+import dask
 import numpy as np
+import scipy.io
 from dask import bag as db
 from dask.diagnostics import ProgressBar
 
@@ -95,6 +98,65 @@ def load(spect_path: str | pathlib.Path, spect_format: str | None = None):
     return spect_dict
 
 
+def _load_arrays(
+    spect_path: pathlib.Path, spect_format: str, keys: list[str]
+):
+    """load only the arrays with the specified keys from a file.
+
+    Used when we do not need the spectrogram itself,
+    e.g., when we are validating the time and frequency bin vectors.
+    For .mat files, only the variables named by ``keys`` are read.
+    For .npz files, ``numpy.load`` already returns an object
+    that reads each array lazily, when it is accessed with its key.
+    """
+    if spect_format == "mat":
+        return scipy.io.loadmat(
+            spect_path, squeeze_me=True, variable_names=keys
+        )
+    return load(spect_path, spect_format)
+
+
+def _spect_shape(
+    spect_path: pathlib.Path, spect_format: str, spect_key: str = "s"
+):
+    """get shape of the spectrogram in an array file,
+    without loading the spectrogram into memory where the format allows it.
+
+    Returns None if ``spect_key`` is not found in the file.
+    """
+    if spect_format == "mat":
+        # ``whosmat`` only reads variable headers, not data
+        shapes = {
+            name: shape for name, shape, _ in scipy.io.whosmat(spect_path)
+        }
+        return shapes.get(spect_key)
+    return _npz_shape(spect_path, spect_key)
+
+
+def _npz_shape(npz_path: pathlib.Path, key: str):
+    """get shape of an array in a .npz file by reading only the header
+    of the .npy file for that array inside the zip archive,
+    instead of reading (and possibly decompressing) the array.
+
+    Returns None if ``key`` is not found in the file.
+    """
+    with zipfile.ZipFile(npz_path) as zf:
+        npy_name = f"{key}.npy"
+        if npy_name not in zf.namelist():
+            return None
+        with zf.open(npy_name) as fp:
+            version = np.lib.format.read_magic(fp)
+            if version == (1, 0):
+                shape, _, _ = np.lib.format.read_array_header_1_0(fp)
+                return shape
+            elif version == (2, 0):
+                shape, _, _ = np.lib.format.read_array_header_2_0(fp)
+                return shape
+    # other versions of the .npy format are rare, just load the array
+    with np.load(npz_path) as npz:
+        return npz[key].shape
+
+
 def timebin_dur(
     spect_path: str | pathlib.Path,
     spect_format: str,
@@ -122,12 +184,116 @@ def timebin_dur(
 
     """
     spect_path = pathlib.Path(spect_path)
-    spect_dict = load(spect_path, spect_format)
+    spect_dict = _load_arrays(spect_path, spect_format, [timebins_key])
     time_bins = spect_dict[timebins_key]
     timebin_dur = timebin_dur_from_vec(time_bins, n_decimals_trunc)
     return timebin_dur
 
 
+def _validate_set_of_spect_files(
+    spect_paths,
+    spect_format,
+    freqbins_key="f",
+    timebins_key="t",
+    spect_key="s",
+    n_decimals_trunc=5,
+    dask_bag_kwargs=None,
+):
+    """validates a set of spectrogram files,
+    as described in ``is_valid_set_of_spect_files``.
+
+    Returns the duration of a time bin, that is the same across all files,
+    so callers that need it do not have to open a file again to get it.
+    """
+    spect_paths = [pathlib.Path(spect_path) for spect_path in spect_paths]
+    if len(spect_paths) == 0:
+        raise ValueError(
+            "spect_paths is empty, cannot validate an empty set of spectrogram files"
+        )
+    if dask_bag_kwargs is None:
+        dask_bag_kwargs = {}
+
+    def _load_and_validate(spect_path):
+        """validates a spectrogram file, then returns frequency bin array
+        and duration of time bins, so those can be validated across files"""
+        # don't load spectrogram, we only need its shape
+        spect_shape = _spect_shape(spect_path, spect_format, spect_key)
+        if spect_shape is None:
+            raise KeyError(
+                f"Did not find a spectrogram in file '{spect_path.name}' "
+                f"using spect_key '{spect_key}'."
+            )
+
+        spect_dict = _load_arrays(
+            spect_path, spect_format, [freqbins_key, timebins_key]
+        )
+
+        freq_bins = spect_dict[freqbins_key]
+        time_bins = spect_dict[timebins_key]
+
+        # number of freq. bins should equal number of rows
+        if freq_bins.shape[-1] != spect_shape[0]:
+            raise ValueError(
+                f"length of frequency bins in {spect_path.name} "
+                "does not match number of rows in spectrogram"
+            )
+        # number of time bins should equal number of columns
+        if time_bins.shape[-1] != spect_shape[1]:
+            raise ValueError(
+                f"length of time_bins in {spect_path.name} "
+                f"does not match number of columns in spectrogram"
+            )
+
+        # only compute this once per file, then we just compare floats
+        timebin_dur = timebin_dur_from_vec(time_bins, n_decimals_trunc)
+        return freq_bins, timebin_dur
+
+    # validate the first file and use it as the reference,
+    # so that every other file can be validated against it independently
+    ref_path = spect_paths[0]
+    ref_freq_bins, ref_timebin_dur = _load_and_validate(ref_path)
+
+    def _validate(spect_path):
+        """validates each spectrogram file,
+        including whether its frequency bins and duration of time bins
+        match those of the reference file"""
+        freq_bins, timebin_dur = _load_and_validate(spect_path)
+
+        if not np.array_equal(freq_bins, ref_freq_bins):
+            raise ValueError(
+                f"Frequency bins in {spect_path.name} do not match "
+                f"frequency bins in {ref_path.name}. "
+                "Frequency bins should be the same across all files."
+            )
+        if timebin_dur != ref_timebin_dur:
+            raise ValueError(
+                f"Duration of time bins in {spect_path.name}, {timebin_dur}, "
+                f"does not match duration in {ref_path.name}, {ref_timebin_dur}. "
+                "Duration of time bins should be the same across all spectrogram files."
+            )
+
+    def _validate_partition(spect_paths_partition):
+        """validates each file in a partition of the bag.
+        Returns an empty list, because we only care whether validation
+        raises an error, so we don't collect a ``None`` for every file"""
+        for spect_path in spect_paths_partition:
+            _validate(spect_path)
+        return []
+
+    logger.info("validating set of spectrogram files")
+
+    if len(spect_paths) > 1:
+        spect_paths_bag = db.from_sequence(spect_paths[1:], **dask_bag_kwargs)
+        with ProgressBar():
+            # validating is I/O-bound, so use threads instead of the default
+            # multiprocessing scheduler for bags, unless user configured a scheduler
+            spect_paths_bag.map_partitions(_validate_partition).compute(
+                scheduler=dask.config.get("scheduler", "threads")
+            )
+
+    return ref_timebin_dur
+
+
 def is_valid_set_of_spect_files(
     spect_paths,
     spect_format,
@@ -135,6 +301,7 @@ def is_valid_set_of_spect_files(
     timebins_key="t",
     spect_key="s",
     n_decimals_trunc=5,
+    dask_bag_kwargs=None,
 ):
     """validate a set of spectrogram files that will be used as a dataset.
     Validates that:
@@ -160,6 +327,10 @@ def is_valid_set_of_spect_files(
         number of decimal places to keep when truncating the timebin duration calculated from
         the vector of time bins.
         Default is 3, i.e. assumes milliseconds is the last significant digit.
+    dask_bag_kwargs : dict
+        Keyword arguments used when calling ``dask.bag.from_sequence``.
+        E.g., ``{partition_size=64}`` so that each task validates
+        a batch of files. Default is None.
 
     Other Parameters
     ----------------
@@ -170,68 +341,13 @@ def is_valid_set_of_spect_files(
     -------
     returns True if all validation checks pass. If not, an error is raised.
     """
-    spect_paths = [pathlib.Path(spect_path) for spect_path in spect_paths]
-
-    def _validate(spect_path):
-        """validates each spectrogram file, then returns frequency bin array
-        and duration of time bins, so that those can be validated across all files
-        """
-        spect_dict = load(spect_path, spect_format)
-
-        if spect_key not in spect_dict:
-            raise KeyError(
-                f"Did not find a spectrogram in file '{spect_path.name}' "
-                f"using spect_key '{spect_key}'."
-            )
-
-        freq_bins = spect_dict[freqbins_key]
-        time_bins = spect_dict[timebins_key]
-        timebin_dur = timebin_dur_from_vec(time_bins, n_decimals_trunc)
-
-        # number of freq. bins should equal number of rows
-        if (
-            spect_dict[freqbins_key].shape[-1]
-            != spect_dict[spect_key].shape[0]
-        ):
-            raise ValueError(
-                f"length of frequency bins in {spect_path.name} "
-                "does not match number of rows in spectrogram"
-            )
-        # number of time bins should equal number of columns
-        if (
-            spect_dict[timebins_key].shape[-1]
-            != spect_dict[spect_key].shape[1]
-        ):
-            raise ValueError(
-                f"length of time_bins in {spect_path.name} "
-                f"does not match number of columns in spectrogram"
-            )
-
-        return spect_path, freq_bins, timebin_dur
-
-    spect_paths_bag = db.from_sequence(spect_paths)
-
-    logger.info("validating set of spectrogram files")
-
-    with ProgressBar():
-        path_freqbins_timebin_dur_tups = list(spect_paths_bag.map(_validate))
-
-    all_freq_bins = np.stack(
-        [tup[1] for tup in path_freqbins_timebin_dur_tups]
+    _validate_set_of_spect_files(
+        spect_paths,
+        spect_format,
+        freqbins_key,
+        timebins_key,
+        spect_key,
+        n_decimals_trunc,
+        dask_bag_kwargs,
     )
-    uniq_freq_bins = np.unique(all_freq_bins, axis=0)
-    if len(uniq_freq_bins) != 1:
-        raise ValueError(
-            f"Found more than one frequency bin vector across files. "
-            f"Instead found {len(uniq_freq_bins)}"
-        )
-
-    timebin_durs = [tup[2] for tup in path_freqbins_timebin_dur_tups]
-    uniq_durs = np.unique(timebin_durs)
-    if len(uniq_durs) != 1:
-        raise ValueError(
-            "Found more than one duration for time bins across spectrogram files. "
-            f"Durations found were: {uniq_durs}"
-        )
-
     return True
@@ -4,8 +4,10 @@ as generated by
 :func:`vak.core.prep.frame_classification.prep_frame_classification_dataset`"""
 from __future__ import annotations
 
+import functools
 import json
 import pathlib
+import sys
 from typing import ClassVar
 
 import attr
@@ -23,26 +25,73 @@ def is_valid_dataset_csv_filename(instance, attribute, value):
         )
 
 
-def is_valid_audio_format(instance, attribute, value):
-    import vak.common.constants
+# below, constants are imported inside functions to avoid circular imports,
+# and cached so validators don't repeat the import every time they are called
+@functools.lru_cache(maxsize=None)
+def _valid_audio_formats() -> frozenset:
+    from vak.common.constants import VALID_AUDIO_FORMATS
+
+    return frozenset(VALID_AUDIO_FORMATS)
+
+
+@functools.lru_cache(maxsize=None)
+def _valid_spect_formats() -> frozenset:
+    from vak.common.constants import VALID_SPECT_FORMATS
+
+    return frozenset(VALID_SPECT_FORMATS)
+
+
+@functools.lru_cache(maxsize=None)
+def _valid_input_types() -> frozenset:
+    from ...prep.constants import INPUT_TYPES
+
+    return frozenset(INPUT_TYPES)
+
+
+def _intern_str(value):
+    """Convert ``value`` to a string and intern it.
+    Used for attributes that only ever take
+    one of a small set of values, e.g. file formats,
+    so every instance shares the same string objects."""
+    return sys.intern(str(value))
 
-    if value not in vak.common.constants.VALID_AUDIO_FORMATS:
+
+def _intern_if_str(value):
+    """Intern ``value`` if it is a string, otherwise return it as is,
+    so that validators can still raise an error for other types."""
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+@functools.lru_cache(maxsize=256)
+def _from_path_cached(cls, json_path: str, mtime_ns: int, size: int):
+    """Load metadata from a json file, cached by path.
+    The time the file was last modified and its size are part of the key,
+    so a file that is re-written is loaded again,
+    even on file systems that only record the time in steps of seconds.
+    Safe to share instances because ``Metadata`` is frozen."""
+    # parse the whole (small) file at once instead of with the streaming parser
+    metadata_json = json.loads(pathlib.Path(json_path).read_text())
+    return cls(**metadata_json)
+
+
+def is_valid_audio_format(instance, attribute, value):
+    if value not in _valid_audio_formats():
         raise ValueError(
-            f"Not a valid audio format: {value}. Valid audio formats are: {vak.common.constants.VALID_AUDIO_FORMATS}"
+            f"Not a valid audio format: {value}. Valid audio formats are: {sorted(_valid_audio_formats())}"
         )
 
 
 def is_valid_spect_format(instance, attribute, value):
-    import vak.common.constants
-
-    if value not in vak.common.constants.VALID_SPECT_FORMATS:
+    if value not in _valid_spect_formats():
         raise ValueError(
             f"Not a valid spectrogram format: {value}. "
-            f"Valid spectrogram formats are: {vak.common.constants.VALID_SPECT_FORMATS}"
+            f"Valid spectrogram formats are: {sorted(_valid_spect_formats())}"
         )
 
 
-@attr.define
+@attr.define(frozen=True)
 class Metadata:
     """A dataclass that represents metadata
     associated with a dataset that was
@@ -70,7 +119,7 @@ class Metadata:
         converter=str, validator=is_valid_dataset_csv_filename
     )
 
-    input_type: str = attr.field()
+    input_type: str = attr.field(converter=_intern_if_str)
 
     @input_type.validator
     def is_valid_input_type(self, attribute, value):
@@ -78,12 +127,10 @@ class Metadata:
             raise TypeError(
                 f"{attribute.name} value should be a string but was type {type(value)}"
             )
-        from ...prep.constants import INPUT_TYPES
-
-        if value not in INPUT_TYPES:
+        if value not in _valid_input_types():
             raise ValueError(
                 f"Value for {attribute.name} is not a valid input type: '{value}'\n"
-                f"Valid input types are: {INPUT_TYPES}"
+                f"Valid input types are: {sorted(_valid_input_types())}"
             )
 
     frame_dur: float = attr.field(converter=float)
@@ -96,13 +143,13 @@ class Metadata:
             raise ValueError(f"{attribute.name} should be greater than zero.")
 
     audio_format: str = attr.field(
-        converter=attr.converters.optional(str),
+        converter=attr.converters.optional(_intern_str),
         validator=attr.validators.optional(is_valid_audio_format),
         default=None,
     )
 
     spect_format: str = attr.field(
-        converter=attr.converters.optional(str),
+        converter=attr.converters.optional(_intern_str),
         validator=attr.validators.optional(is_valid_spect_format),
         default=None,
     )
@@ -127,10 +174,13 @@ class Metadata:
             Instance of :class:`~vak.datasets.frame_classification.FrameClassificationDatatsetMetadata`
             with metadata loaded from json file.
         """
-        json_path = pathlib.Path(json_path)
-        with json_path.open("r") as fp:
-            metadata_json = json.load(fp)
-        return cls(**metadata_json)
+        json_path = pathlib.Path(json_path).resolve()
+        # metadata is loaded many times for the same dataset, e.g. when generating a learning curve,
+        # so we cache instances
+        json_stat = json_path.stat()
+        return _from_path_cached(
+            cls, str(json_path), json_stat.st_mtime_ns, json_stat.st_size
+        )
 
     @classmethod
     def from_dataset_path(cls, dataset_path: str | pathlib.Path):
@@ -170,7 +220,12 @@ class Metadata:
                 f"dataset_path not recognized as a directory: {dataset_path}"
             )
 
-        json_dict = attr.asdict(self)
+        json_dict = {
+            "dataset_csv_filename": self.dataset_csv_filename,
+            "input_type": self.input_type,
+            "frame_dur": self.frame_dur,
+            "audio_format": self.audio_format,
+            "spect_format": self.spect_format,
+        }
         json_path = dataset_path / self.METADATA_JSON_FILENAME
-        with json_path.open("w") as fp:
-            json.dump(json_dict, fp, indent=4)
+        json_path.write_text(json.dumps(json_dict, indent=4))
@@ -154,7 +154,12 @@ class WindowDataset:
         sample_ids = self.sample_ids[
             window_idx: window_idx + self.window_size
         ]
-        uniq_sample_ids = np.unique(sample_ids)
+        # sample ids are in ascending order, and most windows fall within a single sample,
+        # so check the ends of the window before finding unique ids with ``np.unique``
+        if sample_ids[0] == sample_ids[-1]:
+            uniq_sample_ids = sample_ids[:1]
+        else:
+            uniq_sample_ids = np.unique(sample_ids)
         if len(uniq_sample_ids) == 1:
             sample_id = uniq_sample_ids[0]
             frames = np.load(self.dataset_path / self.frames_paths[sample_id])
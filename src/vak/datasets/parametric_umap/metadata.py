@@ -4,8 +4,10 @@ as generated by
 :func:`vak.core.prep.frame_classification.prep_dimensionality_reduction_dataset`"""
 from __future__ import annotations
 
+import functools
 import json
 import pathlib
+import sys
 from typing import ClassVar
 
 import attr
@@ -23,26 +25,58 @@ def is_valid_dataset_csv_filename(instance, attribute, value):
         )
 
 
-def is_valid_audio_format(instance, attribute, value):
-    import vak.common.constants
+# below, constants are imported inside functions to avoid circular imports,
+# and cached so validators don't repeat the import every time they are called
+@functools.lru_cache(maxsize=None)
+def _valid_audio_formats() -> frozenset:
+    from vak.common.constants import VALID_AUDIO_FORMATS
+
+    return frozenset(VALID_AUDIO_FORMATS)
+
+
+@functools.lru_cache(maxsize=None)
+def _valid_spect_formats() -> frozenset:
+    from vak.common.constants import VALID_SPECT_FORMATS
+
+    return frozenset(VALID_SPECT_FORMATS)
+
+
+def _intern_str(value):
+    """Convert ``value`` to a string and intern it.
+    Used for attributes that only ever take
+    one of a small set of values, e.g. file formats,
+    so every instance shares the same string objects."""
+    return sys.intern(str(value))
 
-    if value not in vak.common.constants.VALID_AUDIO_FORMATS:
+
+@functools.lru_cache(maxsize=256)
+def _from_path_cached(cls, json_path: str, mtime_ns: int, size: int):
+    """Load metadata from a json file, cached by path.
+    The time the file was last modified and its size are part of the key,
+    so a file that is re-written is loaded again,
+    even on file systems that only record the time in steps of seconds.
+    Safe to share instances because ``Metadata`` is frozen."""
+    # parse the whole (small) file at once instead of with the streaming parser
+    metadata_json = json.loads(pathlib.Path(json_path).read_text())
+    return cls(**metadata_json)
+
+
+def is_valid_audio_format(instance, attribute, value):
+    if value not in _valid_audio_formats():
         raise ValueError(
-            f"Not a valid audio format: {value}. Valid audio formats are: {vak.common.constants.VALID_AUDIO_FORMATS}"
+            f"Not a valid audio format: {value}. Valid audio formats are: {sorted(_valid_audio_formats())}"
         )
 
 
 def is_valid_spect_format(instance, attribute, value):
-    import vak.common.constants
-
-    if value not in vak.common.constants.VALID_SPECT_FORMATS:
+    if value not in _valid_spect_formats():
         raise ValueError(
             f"Not a valid spectrogram format: {value}. "
-            f"Valid spectrogram formats are: {vak.common.constants.VALID_SPECT_FORMATS}"
+            f"Valid spectrogram formats are: {sorted(_valid_spect_formats())}"
         )
 
 
-@attr.define
+@attr.define(frozen=True)
 class Metadata:
     """A dataclass that represents metadata
     associated with a dataset that was
@@ -79,7 +113,7 @@ class Metadata:
             )
 
     audio_format: str = attr.field(
-        converter=attr.converters.optional(str),
+        converter=attr.converters.optional(_intern_str),
         validator=attr.validators.optional(is_valid_audio_format),
         default=None,
     )
@@ -104,10 +138,13 @@ class Metadata:
             Instance of :class:`~vak.datasets.frame_classification.FrameClassificationDatatsetMetadata`
             with metadata loaded from json file.
         """
-        json_path = pathlib.Path(json_path)
-        with json_path.open("r") as fp:
-            metadata_json = json.load(fp)
-        return cls(**metadata_json)
+        json_path = pathlib.Path(json_path).resolve()
+        # metadata is loaded many times for the same dataset, e.g. when generating a learning curve,
+        # so we cache instances
+        json_stat = json_path.stat()
+        return _from_path_cached(
+            cls, str(json_path), json_stat.st_mtime_ns, json_stat.st_size
+        )
 
     @classmethod
     def from_dataset_path(cls, dataset_path: str | pathlib.Path):
@@ -147,7 +184,10 @@ class Metadata:
                 f"dataset_path not recognized as a directory: {dataset_path}"
             )
 
-        json_dict = attr.asdict(self)
+        json_dict = {
+            "dataset_csv_filename": self.dataset_csv_filename,
+            "shape": list(self.shape),
+            "audio_format": self.audio_format,
+        }
         json_path = dataset_path / self.METADATA_JSON_FILENAME
-        with json_path.open("w") as fp:
-            json.dump(json_dict, fp, indent=4)
+        json_path.write_text(json.dumps(json_dict, indent=4))
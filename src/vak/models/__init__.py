@@ -1,14 +1,38 @@
+import importlib
+
 from . import base, decorator, definition, registry
 from .base import Model
-from .convencoder_umap import ConvEncoderUMAP
-from .ed_tcn import ED_TCN
-from .frame_classification_model import FrameClassificationModel
 from .get import get
-from .parametric_umap_model import ParametricUMAPModel
-from .teenytweetynet import TeenyTweetyNet
-from .tweetynet import TweetyNet
-from .vae_model import VAEModel
-from .ava import AVA
+
+# Model families and models are imported lazily, the first time one is accessed,
+# so that importing ``vak.models`` does not import every model and its dependencies.
+# :mod:`vak.models.registry` imports them all before looking up a model by name.
+_LAZY_ATTRS = {
+    "ConvEncoderUMAP": "convencoder_umap",
+    "ED_TCN": "ed_tcn",
+    "FrameClassificationModel": "frame_classification_model",
+    "ParametricUMAPModel": "parametric_umap_model",
+    "TeenyTweetyNet": "teenytweetynet",
+    "TweetyNet": "tweetynet",
+    "VAEModel": "vae_model",
+    "AVA": "ava",
+}
+_LAZY_MODULES = frozenset(_LAZY_ATTRS.values())
+
+
+def __getattr__(name: str):
+    """Module-level __getattr__ function that we use to import models lazily."""
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__)
+        attr = getattr(module, name)
+    elif name in _LAZY_MODULES:
+        attr = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # cache so __getattr__ is only called the first time
+    globals()[name] = attr
+    return attr
+
 
 __all__ = [
     "base",
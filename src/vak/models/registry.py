@@ -78,8 +78,28 @@ def register_model(model_class: Type) -> None:
     return model_class
 
 
+def _import_builtin_models() -> None:
+    """Import the models built into ``vak``, so that they are registered.
+
+    :mod:`vak.models` imports these models lazily,
+    so we need to make sure they have been imported
+    before we determine models from the registry.
+    """
+    from .. import models
+
+    for name in models.__all__:
+        getattr(models, name)
+
+
 def __getattr__(name: str) -> Any:
     """Module-level __getattr__ function that we use to dynamically determine models."""
+    if name in (
+        "MODEL_FAMILY_FROM_NAME",
+        "MODEL_CLASS_BY_NAME",
+        "MODEL_NAMES",
+    ):
+        _import_builtin_models()
+
     if name == "MODEL_FAMILY_FROM_NAME":
         return {
             model_name: family_name
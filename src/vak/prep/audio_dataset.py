@@ -118,14 +118,16 @@ def prep_audio_dataset(
             # loop in a verbose way (i.e. not a comprehension)
             # so we can give user warning when we skip files
             annot_labelset = set(annot.seq.labels)
-            # below, set(labels_mapping) is a set of that dict's keys
-            if not annot_labelset.issubset(set(labelset)):
+            # labelset was already converted to a set above, don't re-build it for every file
+            if not annot_labelset.issubset(labelset):
                 # because there's some label in labels that's not in labelset
                 audio_annot_map.pop(audio_file)
                 extra_labels = annot_labelset - labelset
                 logger.info(
-                    f"Found labels, {extra_labels}, in {pathlib.Path(audio_file).name}, "
+                    "Found labels, %s, in %s, "
                     "that are not in labels_mapping. Skipping file.",
+                    extra_labels,
+                    pathlib.Path(audio_file).name,
                 )
 
     # ---- actually make the dataframe ---------------------------------------------------------------------------------
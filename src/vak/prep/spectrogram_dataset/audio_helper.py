@@ -200,14 +200,16 @@ def make_spectrogram_files_from_audio_files(
                 # loop in a verbose way (i.e. not a comprehension)
                 # so we can give user warning when we skip files
                 annot_labelset = set(annot.seq.labels)
-                # below, set(labels_mapping) is a set of that dict's keys
-                if not annot_labelset.issubset(set(labelset)):
+                # labelset was already converted to a set above, don't re-build it for every file
+                if not annot_labelset.issubset(labelset):
                     # because there's some label in labels that's not in labelset
                     audio_annot_map.pop(audio_file)
                     extra_labels = annot_labelset - labelset
                     logger.info(
-                        f"Found labels, {extra_labels}, in {Path(audio_file).name}, "
+                        "Found labels, %s, in %s, "
                         "that are not in labels_mapping. Skipping file.",
+                        extra_labels,
+                        Path(audio_file).name,
                     )
         audio_files = sorted(list(audio_annot_map.keys()))
 
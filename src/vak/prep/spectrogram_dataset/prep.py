@@ -26,6 +26,7 @@ def prep_spectrogram_dataset(
     spect_params: dict | None = None,
     spect_output_dir: str | pathlib.Path | None = None,
     audio_dask_bag_kwargs: dict | None = None,
+    spect_dask_bag_kwargs: dict | None = None,
 ) -> pd.DataFrame:
     """Make a dataset of spectrograms,
     optionally paired with annotations.
@@ -82,6 +83,13 @@ def prep_spectrogram_dataset(
         e.g., ``audio_dask_bag_kwargs = { npartitions = 20 }``.
         Allows for finer-grained control
         when needed to process files of different sizes.
+    spect_dask_bag_kwargs : dict
+        Keyword arguments used when calling ``dask.bag.from_sequence``
+        inside :func:`vak.prep.spectrogram_dataset.spect_helper.make_dataframe_of_spect_files`,
+        where it is used to parallelize validating spectrogram files
+        and making the records for the dataset.
+        E.g., ``{partition_size=64}`` batches files into
+        fewer, larger tasks.
 
     Returns
     -------
@@ -170,6 +178,7 @@ def prep_spectrogram_dataset(
         "annot_format": annot_format,
         "spect_ext": spect_ext,
         "spect_output_dir": spect_output_dir,
+        "dask_bag_kwargs": spect_dask_bag_kwargs,
     }
 
     if (
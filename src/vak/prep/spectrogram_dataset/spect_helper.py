@@ -6,8 +6,10 @@ the returned DataFrame has columns as specified by vak.io.spect.DF_COLUMNS
 from __future__ import annotations
 
 import logging
+import os
 import pathlib
 
+import dask
 import dask.bag as db
 import numpy as np
 import pandas as pd
@@ -46,6 +48,7 @@ def make_dataframe_of_spect_files(
     timebins_key: str = "t",
     spect_key: str = "s",
     audio_path_key: str = "audio_path",
+    dask_bag_kwargs: dict | None = None,
 ):
     """Get a dataset of spectrograms and optional annotations as a Pandas DataFrame.
 
@@ -94,6 +97,12 @@ def make_dataframe_of_spect_files(
     audio_path_key : str
         key for accessing path to source audio file for spectrogram in files.
         Default is 'audio_path'.
+    dask_bag_kwargs : dict
+        Keyword arguments used when calling ``dask.bag.from_sequence``,
+        both to validate the spectrogram files and to make the records
+        for the DataFrame. E.g., ``{partition_size=64}`` so that each task
+        processes a batch of files, instead of one task per file.
+        Default is None, in which case ``dask`` chooses the partitions.
 
     Returns
     -------
@@ -172,6 +181,9 @@ def make_dataframe_of_spect_files(
     if labelset is not None:
         labelset = labelset_to_set(labelset)
 
+    if dask_bag_kwargs is None:
+        dask_bag_kwargs = {}  # so ``db.from_sequence(**dask_bag_kwargs)`` works below
+
     if spect_output_dir:
         spect_output_dir = expanded_user_path(spect_output_dir)
         if not spect_output_dir.is_dir():
@@ -181,10 +193,20 @@ def make_dataframe_of_spect_files(
 
     # ---- get a list of spectrogram files + associated annotation files -----------------------------------------------
     if spect_dir:  # then get spect_files from that dir
-        # note we already validated format above
+        # note we already validated format above.
+        # Walk the directory tree and check the suffix of each filename,
+        # instead of matching a recursive glob pattern against every path;
+        # this is much faster for directories with many files
         spect_files = sorted(
-            pathlib.Path(spect_dir).glob(f"**/*{spect_format}")
+            pathlib.Path(root) / filename
+            for root, _, filenames in os.walk(spect_dir)
+            for filename in filenames
+            if filename.endswith(spect_format)
         )
+        if len(spect_files) == 0:
+            raise ValueError(
+                f"No files with format '{spect_format}' found in spect_dir: {spect_dir}"
+            )
 
     if spect_files:  # (or if we just got them from spect_dir)
         if annot_list:
@@ -205,34 +227,40 @@ def make_dataframe_of_spect_files(
             spect_annot_map.items()
         ):  # `list` so we can pop from dict without RuntimeError
             annot_labelset = set(annot.seq.labels)
-            # below, set(labels_mapping) is a set of that dict's keys
-            if not annot_labelset.issubset(set(labelset)):
+            # labelset was already converted to a set above, don't re-build it for every file
+            if not annot_labelset.issubset(labelset):
                 spect_annot_map.pop(spect_path)
                 # because there's some label in labels that's not in labelset
-                extra_labels = annot_labelset - set(labelset)
+                extra_labels = annot_labelset - labelset
                 logger.info(
-                    f"Found labels, {extra_labels}, in {pathlib.Path(spect_path).name}, "
+                    "Found labels, %s, in %s, "
                     "that are not in labels_mapping. Skipping file.",
+                    extra_labels,
+                    pathlib.Path(spect_path).name,
                 )
                 continue
 
     # ---- validate set of spectrogram files ---------------------------------------------------------------------------
     # regardless of whether we just made it or user supplied it
     spect_paths = list(spect_annot_map.keys())
-    files.spect.is_valid_set_of_spect_files(
+    # check this before we open any files
+    if len(spect_paths) == 0:
+        if labelset:
+            raise ValueError(
+                "No spectrogram files left to make dataset after removing files "
+                f"with labels not in labelset: {labelset}"
+            )
+        raise ValueError("No spectrogram files to make dataset.")
+    # validation returns the duration of a time bin, which we know is consistent across files,
+    # so we don't need to open a file again to get it
+    timebin_dur = files.spect._validate_set_of_spect_files(
         spect_paths,
         spect_format,
         freqbins_key,
         timebins_key,
         spect_key,
         n_decimals_trunc,
-    )
-
-    # now that we have validated that duration of time bins is consistent across files, we can just open one file
-    # to get that time bin duration. This way validation function has no side effects, like returning time bin, and
-    # this is still relatively fast compared to looping through all files again
-    timebin_dur = files.spect.timebin_dur(
-        spect_paths[0], spect_format, timebins_key, n_decimals_trunc
+        dask_bag_kwargs=dask_bag_kwargs,
     )
 
     # ---- actually make the dataframe ---------------------------------------------------------------------------------
@@ -244,8 +272,13 @@ def make_dataframe_of_spect_files(
         and (2) annotation for that file"""
         spect_path, annot = spect_annot_tuple
         spect_dict = files.spect.load(spect_path, spect_format)
+        # for .npz files, every ``__getitem__`` re-reads the array from the archive,
+        # so get the time bins once
+        time_bins = spect_dict[timebins_key]
 
-        spect_dur = spect_dict[spect_key].shape[-1] * timebin_dur
+        # use length of time bins vector, that we validated above,
+        # so we don't load the spectrogram from .npz files just to get its shape
+        spect_dur = time_bins.shape[-1] * timebin_dur
         if audio_path_key in spect_dict:
             audio_path = spect_dict[audio_path_key]
             if isinstance(audio_path, np.ndarray):
@@ -261,7 +294,7 @@ def make_dataframe_of_spect_files(
             # convert to .npz and save in spect_output_dir
             spect_dict_npz = {
                 "s": spect_dict[spect_key],
-                "t": spect_dict[timebins_key],
+                "t": time_bins,
                 "f": spect_dict[freqbins_key],
             }
             spect_path = spect_output_dir / (
@@ -294,11 +327,17 @@ def make_dataframe_of_spect_files(
         )
         return record
 
-    spect_path_annot_tuples = db.from_sequence(spect_annot_map.items())
+    spect_path_annot_tuples = db.from_sequence(
+        spect_annot_map.items(), **dask_bag_kwargs
+    )
     logger.info(
         "creating pandas.DataFrame representing dataset from spectrogram files",
     )
     with ProgressBar():
-        records = list(spect_path_annot_tuples.map(_to_record))
+        # loading files is I/O-bound, so use threads instead of the default
+        # multiprocessing scheduler for bags, unless user configured a scheduler
+        records = spect_path_annot_tuples.map(_to_record).compute(
+            scheduler=dask.config.get("scheduler", "threads")
+        )
 
     return pd.DataFrame.from_records(data=records, columns=DF_COLUMNS)
@@ -8,6 +8,8 @@ import numpy as np
 
 from .validate import validate_split_durations
 
+logger = logging.getLogger(__name__)
+
 
 def unique_set_from_labels(labels: list[np.array]):
     """Helper function to generate the set of unique labels in a list of label arrays.
@@ -108,9 +110,6 @@ def brute_force(
     in each set and then adds files to reach the required
     durations.
     """
-    logger = logging.getLogger(__name__)
-    logger.setLevel("INFO")
-
     validate_labels(labels, labelset)
 
     sum_durs = sum(durs)
@@ -190,8 +189,9 @@ def brute_force(
                     except IndexError:
                         if len(label_inds) == 0:
                             logger.debug(
-                                "Ran out of elements while dividing dataset into subsets of specified durations."
-                                f"Iteration {iter}"
+                                "Ran out of elements while dividing dataset into subsets of specified durations. "
+                                "Iteration %s",
+                                iter,
                             )
                             iter += 1
                             break  # do next iteration
@@ -224,8 +224,9 @@ def brute_force(
             except IndexError:
                 if len(durs_labels_inds) == 0:
                     logger.debug(
-                        "Ran out of elements while dividing dataset into subsets of specified durations."
-                        f"Iteration {iter}"
+                        "Ran out of elements while dividing dataset into subsets of specified durations. "
+                        "Iteration %s",
+                        iter,
                     )
                     iter += 1
                     break  # do next iteration
@@ -294,8 +295,11 @@ def brute_force(
                             raise ValueError(all_labels_err)
                         else:
                             logger.debug(
-                                f"Set of unique labels in '{split_name}' split did not equal specified labelset. "
-                                f"Getting new '{split_name}' split. Iteration: {iter}"
+                                "Set of unique labels in '%s' split did not equal specified labelset. "
+                                "Getting new '%s' split. Iteration: %s",
+                                split_name,
+                                split_name,
+                                iter,
                             )
                             continue
 
@@ -240,10 +240,17 @@ def train_frame_classification_model(
 
     if train_transform_params is None:
         train_transform_params = {}
-    train_transform_params.update({"spect_standardizer": spect_standardizer})
+    # we standardize whole batches in ``collate_fn`` below, instead of each window in the dataset's transform
+    train_transform_params.update({"spect_standardizer": None})
     transform, target_transform = transforms.defaults.get_default_transform(
         model_name, "train", transform_kwargs=train_transform_params
     )
+    if spect_standardizer is not None:
+        collate_fn = transforms.defaults.frame_classification.StandardizeSpectCollate(
+            spect_standardizer
+        )
+    else:
+        collate_fn = None
 
     if train_dataset_params is None:
         train_dataset_params = {}
@@ -261,6 +268,7 @@ def train_frame_classification_model(
         dataset=train_dataset,
         shuffle=shuffle,
         batch_size=batch_size,
+        collate_fn=collate_fn,
         num_workers=num_workers,
     )
 
@@ -18,26 +18,36 @@ from ..datasets.parametric_umap import ParametricUMAPDataset
 logger = logging.getLogger(__name__)
 
 
-def get_split_dur(df: pd.DataFrame, split: str) -> float:
-    """Get duration of a split in a dataset from a pandas DataFrame representing the dataset."""
-    return df[df["split"] == split]["duration"].sum()
-
-
 def get_trainer(
     max_epochs: int,
     ckpt_root: str | pathlib.Path,
     ckpt_step: int,
     log_save_dir: str | pathlib.Path,
     device: str = "cuda",
+    precision: int | str | None = None,
 ) -> lightning.Trainer:
     """Returns an instance of ``lightning.Trainer``
     with a default set of callbacks.
-    Used by ``vak.core`` functions."""
+    Used by ``vak.core`` functions.
+
+    If ``precision`` is None, training on a GPU uses
+    ``"bf16"`` mixed precision on GPUs that support it
+    (compute capability 8.0 and above), and 32-bit precision otherwise.
+    Training on the CPU uses 32-bit precision."""
     if device == "cuda":
         accelerator = "gpu"
     else:
         accelerator = None
 
+    if precision is None:
+        if device == "cuda" and torch.cuda.is_available():
+            if torch.cuda.get_device_capability()[0] >= 8:
+                precision = "bf16"
+            else:
+                precision = 32
+        else:
+            precision = 32
+
     ckpt_callback = lightning.callbacks.ModelCheckpoint(
         dirpath=ckpt_root,
         filename="checkpoint",
@@ -71,6 +81,10 @@ def get_trainer(
         accelerator=accelerator,
         logger=logger,
         callbacks=callbacks,
+        precision=precision,
+        # samples in a parametric UMAP dataset all have the same shape,
+        # so let cuDNN find the fastest algorithms once and then re-use them
+        benchmark=True,
     )
     return trainer
 
@@ -94,6 +108,7 @@ def train_parametric_umap_model(
     ckpt_step: int | None = None,
     device: str | None = None,
     split: str = "train",
+    precision: int | str | None = None,
 ) -> None:
     """Train a model from the parametric UMAP family
     and save results.
@@ -163,6 +178,10 @@ def train_parametric_umap_model(
         when training model. Default is 'train'. This parameter is used by
         `vak.learncurve.learncurve` to specify specific subsets of the
         training set to use when training models for a learning curve.
+    precision : int, str, optional
+        Precision used by ``lightning.Trainer``, e.g. 32, 16, or ``"bf16"``.
+        Default is None, in which case ``"bf16"`` mixed precision is used
+        on GPUs that support it, and 32-bit precision otherwise.
     """
     for path, path_name in zip(
         (checkpoint_path,),
@@ -187,7 +206,13 @@ def train_parametric_umap_model(
         dataset_path
     )
     dataset_csv_path = dataset_path / metadata.dataset_csv_filename
-    dataset_df = pd.read_csv(dataset_csv_path)
+    # we only need these columns, to check pre-conditions and get durations of splits
+    dataset_df = pd.read_csv(
+        dataset_csv_path,
+        usecols=["split", "duration"],
+        dtype={"split": "category"},
+    )
+    split_durs = dataset_df.groupby("split", observed=True)["duration"].sum()
     # ---------------- pre-conditions ----------------------------------------------------------------------------------
     if val_step and not dataset_df["split"].str.contains("val").any():
         raise ValueError(
@@ -206,25 +231,42 @@ def train_parametric_umap_model(
         results_path = generate_results_dir_name_as_path(root_results_dir)
         results_path.mkdir()
 
+    if device is None:
+        device = get_default_device()
+
+    # keep worker processes alive across epochs instead of re-spawning them,
+    # and use pinned memory so copies to the GPU can overlap with compute
+    dataloader_kwargs = {
+        "num_workers": num_workers,
+        "pin_memory": device == "cuda",
+    }
+    if num_workers > 0:
+        # these options are only valid when loading data with worker processes
+        dataloader_kwargs["persistent_workers"] = True
+        dataloader_kwargs["prefetch_factor"] = 4
+
     # ---------------- load training data  -----------------------------------------------------------------------------
     logger.info(f"using training dataset from {dataset_path}")
     # below, if we're going to train network to predict unlabeled segments, then
     # we need to include a class for those unlabeled segments in labelmap,
     # the mapping from labelset provided by user to a set of consecutive
     # integers that the network learns to predict
-    train_dur = get_split_dur(dataset_df, "train")
+    train_dur = split_durs.get("train", 0.0)
     logger.info(
         f"Total duration of training split from dataset (in s): {train_dur}",
     )
 
+    # padding only depends on the shape of samples in the dataset,
+    # so we compute it once and use it for both training and validation
+    if model_name == "ConvEncoderUMAP":
+        padding = models.convencoder_umap.get_default_padding(metadata.shape)
+    else:
+        padding = None
+
     if train_transform_params is None:
         train_transform_params = {}
-    if (
-        "padding" not in train_transform_params
-        and model_name == "ConvEncoderUMAP"
-    ):
-        padding = models.convencoder_umap.get_default_padding(metadata.shape)
-        train_transform_params["padding"] = padding
+    if padding is not None:
+        train_transform_params.setdefault("padding", padding)
     transform = transforms.defaults.get_default_transform(
         model_name, "train", train_transform_params
     )
@@ -244,21 +286,15 @@ def train_parametric_umap_model(
         dataset=train_dataset,
         shuffle=shuffle,
         batch_size=batch_size,
-        num_workers=num_workers,
+        **dataloader_kwargs,
     )
 
     # ---------------- load validation set (if there is one) -----------------------------------------------------------
     if val_step:
         if val_transform_params is None:
             val_transform_params = {}
-        if (
-            "padding" not in val_transform_params
-            and model_name == "ConvEncoderUMAP"
-        ):
-            padding = models.convencoder_umap.get_default_padding(
-                metadata.shape
-            )
-            val_transform_params["padding"] = padding
+        if padding is not None:
+            val_transform_params.setdefault("padding", padding)
         transform = transforms.defaults.get_default_transform(
             model_name, "eval", val_transform_params
         )
@@ -277,14 +313,11 @@ def train_parametric_umap_model(
             dataset=val_dataset,
             shuffle=False,
             batch_size=batch_size,
-            num_workers=num_workers,
+            **dataloader_kwargs,
         )
     else:
         val_loader = None
 
-    if device is None:
-        device = get_default_device()
-
     model = models.get(
         model_name,
         model_config,
@@ -308,6 +341,7 @@ def train_parametric_umap_model(
         device=device,
         ckpt_root=ckpt_root,
         ckpt_step=ckpt_step,
+        precision=precision,
     )
     train_time_start = datetime.datetime.now()
     logger.info(f"Training start time: {train_time_start.isoformat()}")
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 from typing import Callable
 
+import torch
 import torchvision.transforms
 
 from .. import transforms as vak_transforms
@@ -24,23 +25,19 @@ class TrainItemTransform:
         self,
         spect_standardizer=None,
     ):
+        # convert to tensor first, then standardize the tensor:
+        # subtracting the mean makes a new tensor, which is then multiplied in place
+        source_transform = [vak_transforms.ToFloatTensor()]
         if spect_standardizer is not None:
             if isinstance(spect_standardizer, vak_transforms.StandardizeSpect):
-                source_transform = [spect_standardizer]
+                source_transform.append(spect_standardizer)
             else:
                 raise TypeError(
                     f"invalid type for spect_standardizer: {type(spect_standardizer)}. "
                     "Should be an instance of vak.transforms.StandardizeSpect"
                 )
-        else:
-            source_transform = []
 
-        source_transform.extend(
-            [
-                vak_transforms.ToFloatTensor(),
-                vak_transforms.AddChannel(),
-            ]
-        )
+        source_transform.append(vak_transforms.AddChannel())
         self.source_transform = torchvision.transforms.Compose(
             source_transform
         )
@@ -60,6 +57,34 @@ class TrainItemTransform:
         return item
 
 
+class StandardizeSpectCollate:
+    """Collate function used when training frame classification models,
+    that standardizes a whole batch of windows at once.
+
+    Windows are first collated into a batch with
+    :func:`torch.utils.data.dataloader.default_collate`,
+    and then the batch tensor is standardized with
+    :class:`vak.transforms.StandardizeSpect`,
+    instead of standardizing each window separately
+    in the transform of the dataset.
+    """
+
+    def __init__(self, spect_standardizer):
+        if not isinstance(spect_standardizer, vak_transforms.StandardizeSpect):
+            raise TypeError(
+                f"invalid type for spect_standardizer: {type(spect_standardizer)}. "
+                "Should be an instance of vak.transforms.StandardizeSpect"
+            )
+        self.spect_standardizer = spect_standardizer
+
+    def __call__(self, samples):
+        frames, frame_labels = torch.utils.data.dataloader.default_collate(
+            samples
+        )
+        frames = self.spect_standardizer(frames)
+        return frames, frame_labels
+
+
 class EvalItemTransform:
     """Default transform used when evaluating frame classification models.
 
@@ -88,13 +113,13 @@ class EvalItemTransform:
                 )
         self.spect_standardizer = spect_standardizer
 
-        self.pad_to_window = vak_transforms.PadToWindow(
+        # pad and reshape into a batch of windows in one step
+        self.pad_and_window = vak_transforms.PadAndWindow(
             window_size, padval, return_padding_mask=return_padding_mask
         )
 
         self.source_transform_after_pad = torchvision.transforms.Compose(
             [
-                vak_transforms.ViewAsWindowBatch(window_size),
                 vak_transforms.ToFloatTensor(),
                 # below, add channel at first dimension because windows become batch
                 vak_transforms.AddChannel(channel_dim=channel_dim),
@@ -107,10 +132,10 @@ class EvalItemTransform:
         if self.spect_standardizer:
             frames = self.spect_standardizer(frames)
 
-        if self.pad_to_window.return_padding_mask:
-            frames, padding_mask = self.pad_to_window(frames)
+        if self.pad_and_window.return_padding_mask:
+            frames, padding_mask = self.pad_and_window(frames)
         else:
-            frames = self.pad_to_window(frames)
+            frames = self.pad_and_window(frames)
             padding_mask = None
         frames = self.source_transform_after_pad(frames)
 
@@ -158,13 +183,13 @@ class PredictItemTransform:
                 )
         self.spect_standardizer = spect_standardizer
 
-        self.pad_to_window = vak_transforms.PadToWindow(
+        # pad and reshape into a batch of windows in one step
+        self.pad_and_window = vak_transforms.PadAndWindow(
             window_size, padval, return_padding_mask=return_padding_mask
         )
 
         self.source_transform_after_pad = torchvision.transforms.Compose(
             [
-                vak_transforms.ViewAsWindowBatch(window_size),
                 vak_transforms.ToFloatTensor(),
                 # below, add channel at first dimension because windows become batch
                 vak_transforms.AddChannel(channel_dim=channel_dim),
@@ -175,10 +200,10 @@ class PredictItemTransform:
         if self.spect_standardizer:
             frames = self.spect_standardizer(frames)
 
-        if self.pad_to_window.return_padding_mask:
-            frames, padding_mask = self.pad_to_window(frames)
+        if self.pad_and_window.return_padding_mask:
+            frames, padding_mask = self.pad_and_window(frames)
         else:
-            frames = self.pad_to_window(frames)
+            frames = self.pad_and_window(frames)
             padding_mask = None
 
         frames = self.source_transform_after_pad(frames)
@@ -227,7 +252,7 @@ def get_default_frame_classification_transform(
 
     """
     spect_standardizer = transform_kwargs.get("spect_standardizer", None)
-    # regardless of mode, transform always starts with StandardizeSpect, if used
+    # check type here, since StandardizeSpect is used by the transform for every mode
     if spect_standardizer is not None:
         if not isinstance(spect_standardizer, vak_transforms.StandardizeSpect):
             raise TypeError(
@@ -236,17 +261,12 @@ def get_default_frame_classification_transform(
             )
 
     if mode == "train":
+        # convert to tensor first, then standardize the tensor:
+        # subtracting the mean makes a new tensor, which is then multiplied in place
+        transform = [vak_transforms.ToFloatTensor()]
         if spect_standardizer is not None:
-            transform = [spect_standardizer]
-        else:
-            transform = []
-
-        transform.extend(
-            [
-                vak_transforms.ToFloatTensor(),
-                vak_transforms.AddChannel(),
-            ]
-        )
+            transform.append(spect_standardizer)
+        transform.append(vak_transforms.AddChannel())
         transform = torchvision.transforms.Compose(transform)
 
         target_transform = vak_transforms.ToLongTensor()
@@ -1,16 +1,56 @@
+import numba
 import numpy as np
 import torch
 
 __all__ = [
+    "pad_and_window",
     "pad_to_window",
     "standardize_spect",
+    "standardize_spect_torch",
     "to_floattensor",
     "to_longtensor",
     "view_as_window_batch",
+    "view_as_window_batch_torch",
 ]
 
 
-def standardize_spect(spect, mean_freqs, std_freqs, non_zero_std):
+@numba.njit(cache=True)
+def _standardize_spect_2d(spect, mean_freqs, inv_std, out):
+    """standardize a 2-d spectrogram in a single pass over memory,
+    instead of one pass to subtract the mean and another to multiply.
+    Not parallelized, since this usually runs in DataLoader worker processes."""
+    for freq_ind in range(spect.shape[0]):
+        mean = mean_freqs[freq_ind]
+        inv = inv_std[freq_ind]
+        for time_ind in range(spect.shape[1]):
+            out[freq_ind, time_ind] = (spect[freq_ind, time_ind] - mean) * inv
+    return out
+
+
+def _inv_std(std_freqs, non_zero_std):
+    """reciprocal of standard deviation for each frequency bin,
+    used by :func:`standardize_spect` to multiply instead of divide.
+    Values are 1.0 where standard deviation is zero,
+    so those frequency bins are only mean-subtracted."""
+    inv_std = np.ones_like(std_freqs, dtype=np.result_type(std_freqs, 1.0))
+    inv_std[non_zero_std] = 1.0 / std_freqs[non_zero_std]
+    return inv_std
+
+
+def _is_kernel_dtype(*arrs):
+    """returns True if all arrays are native-endian float32 or float64,
+    the dtypes that :func:`_standardize_spect_2d` is compiled for.
+    Any other dtype, e.g. float16 or big-endian floats read from a file,
+    is standardized with NumPy instead."""
+    return all(
+        arr.dtype.isnative and arr.dtype.type in (np.float32, np.float64)
+        for arr in arrs
+    )
+
+
+def standardize_spect(
+    spect, mean_freqs, std_freqs, non_zero_std, out=None, inv_std=None
+):
     """standardize spectrogram by subtracting off mean and dividing by standard deviation.
 
     Parameters
@@ -23,6 +63,14 @@ def standardize_spect(spect, mean_freqs, std_freqs, non_zero_std):
         vector of standard deviations for each frequency bin across the fit set of spectrograms
     non_zero_std : numpy.ndarray
         boolean, indicates where std_freqs has non-zero values. Used to avoid divide-by-zero errors.
+    out : numpy.ndarray, optional
+        Array with the same shape as ``spect`` that the result is written into.
+        Can be ``spect`` itself, to standardize in place.
+        Default is None, in which case a new array is allocated.
+    inv_std : numpy.ndarray, optional
+        Reciprocal of ``std_freqs``, with values of 1.0 where ``std_freqs`` is zero.
+        Callers that standardize many spectrograms can compute this once and re-use it.
+        Default is None, in which case it is computed from ``std_freqs`` and ``non_zero_std``.
 
     Returns
     -------
@@ -30,15 +78,52 @@ def standardize_spect(spect, mean_freqs, std_freqs, non_zero_std):
         with same shape as spect but with (approximately) zero mean and unit standard deviation
         (mean and standard devation will still vary by batch).
     """
-    tfm = spect - mean_freqs[:, np.newaxis]  # need axis for broadcasting
-    # keep any stds that are zero from causing NaNs
-    tfm[non_zero_std, :] = (
-        tfm[non_zero_std, :] / std_freqs[non_zero_std, np.newaxis]
-    )
+    if inv_std is None:
+        # keep any stds that are zero from causing NaNs
+        inv_std = _inv_std(std_freqs, non_zero_std)
+    if spect.ndim == 2:
+        # the compiled kernel does not check bounds, so check shapes before calling it
+        if not (
+            mean_freqs.shape[0] == inv_std.shape[0] == spect.shape[0]
+        ):
+            raise ValueError(
+                f"Length of mean_freqs, {mean_freqs.shape[0]}, and of std_freqs or inv_std, {inv_std.shape[0]}, "
+                f"must equal number of frequency bins in spect, {spect.shape[0]}"
+            )
+        if out is None:
+            out = np.empty(
+                spect.shape, dtype=np.result_type(spect, mean_freqs)
+            )
+        elif out.shape != spect.shape:
+            raise ValueError(
+                f"Shape of out, {out.shape}, must equal shape of spect, {spect.shape}"
+            )
+        if _is_kernel_dtype(spect, mean_freqs, inv_std, out):
+            return _standardize_spect_2d(spect, mean_freqs, inv_std, out)
+
+    # need axis for broadcasting
+    tfm = np.subtract(spect, mean_freqs[:, np.newaxis], out=out)
+    # multiply in place by reciprocal, instead of dividing a fancy-indexed copy
+    np.multiply(tfm, inv_std[:, np.newaxis], out=tfm)
     return tfm
 
 
-def pad_to_window(arr, window_size, padval=0.0, return_padding_mask=True):
+def _empty_or_out(out, shape, dtype):
+    """returns ``out`` if it is an array with the specified shape and dtype,
+    otherwise returns a new (uninitialized) array"""
+    if out is not None and out.shape == shape and out.dtype == dtype:
+        return out
+    return np.empty(shape, dtype=dtype)
+
+
+def pad_to_window(
+    arr,
+    window_size,
+    padval=0.0,
+    return_padding_mask=True,
+    out=None,
+    padding_mask_out=None,
+):
     """pad a 1d or 2d array so that it can be reshaped
     into consecutive windows of specified size
 
@@ -59,11 +144,24 @@ def pad_to_window(arr, window_size, padval=0.0, return_padding_mask=True):
         plus padding at the end, and has values of 1 where
         columns in padded are from the original array,
         and values of 0 where columns were added for padding.
+    out : numpy.ndarray, optional
+        Array that padded array is written into.
+        Only used if it has the same shape and dtype
+        as the padded array, otherwise a new array is allocated.
+        Default is None.
+    padding_mask_out : numpy.ndarray, optional
+        Boolean vector that padding mask is written into.
+        Only used if it has the same shape as the padding mask,
+        otherwise a new array is allocated.
+        Default is None.
 
     Returns
     -------
     padded : numpy.ndarray
-        Padded with ``padval``
+        Padded with ``padval``.
+        Has the same dtype as ``arr``, unless
+        ``padval`` requires a different dtype,
+        e.g. a float ``padval`` with an integer ``arr``.
     padding_mask : numpy.ndarray
         Boolean vector with size equal to width of padded,
         i.e. original size plus padding at the end.
@@ -81,23 +179,137 @@ def pad_to_window(arr, window_size, padval=0.0, return_padding_mask=True):
             f"input array must be 1d or 2d but number of dimensions was: {arr.ndim}"
         )
 
-    target_width = int(np.ceil(width / window_size) * window_size)
+    # ceiling division with integers, instead of with ``np.ceil``
+    target_width = -(-width // window_size) * window_size
 
+    # allocate without initializing, then only fill the padding with padval;
+    # use dtype of arr (unless padval can't be represented with it),
+    # so we don't e.g. convert float32 spectrograms to float64
+    dtype = np.result_type(arr.dtype, padval)
     if arr.ndim == 1:
-        padded = np.ones((target_width,)) * padval
+        padded = _empty_or_out(out, (target_width,), dtype)
         padded[:width] = arr
+        padded[width:] = padval
     elif arr.ndim == 2:
-        padded = np.ones((height, target_width)) * padval
+        padded = _empty_or_out(out, (height, target_width), dtype)
         padded[:, :width] = arr
+        padded[:, width:] = padval
 
     if return_padding_mask:
-        padding_mask = np.zeros((target_width,), dtype=bool)
+        padding_mask = _empty_or_out(padding_mask_out, (target_width,), bool)
         padding_mask[:width] = True
+        padding_mask[width:] = False
         return padded, padding_mask
     else:
         return padded
 
 
+def standardize_spect_torch(spect, mean_freqs, inv_std):
+    """standardize spectrogram tensor by subtracting off mean
+    and multiplying by reciprocal of standard deviation.
+
+    Works on a single spectrogram or a batch, on any device,
+    so that e.g. a whole batch can be standardized
+    with a couple of operations on the GPU.
+
+    Parameters
+    ----------
+    spect : torch.Tensor
+        with shape (..., frequencies, time bins)
+    mean_freqs : torch.Tensor
+        vector of mean values for each frequency bin across the fit set of spectrograms
+    inv_std : torch.Tensor
+        vector, reciprocal of standard deviation for each frequency bin
+        across the fit set of spectrograms, with values of 1.0
+        where standard deviation is zero.
+
+    Returns
+    -------
+    transformed : torch.Tensor
+        with same shape as spect but with (approximately) zero mean and unit standard deviation
+    """
+    mean_freqs = mean_freqs.to(device=spect.device, dtype=spect.dtype)
+    inv_std = inv_std.to(device=spect.device, dtype=spect.dtype)
+    # need axis for broadcasting; subtraction returns a new tensor so multiply in place
+    return (spect - mean_freqs[:, None]).mul_(inv_std[:, None])
+
+
+def pad_and_window(arr, window_size, padval=0.0, return_padding_mask=True):
+    """pad a 1d or 2d array and return it as a batch of non-overlapping windows.
+
+    Equivalent to calling :func:`pad_to_window` and then
+    :func:`view_as_window_batch`, but writes ``arr`` directly
+    into a contiguous array with shape (windows, height, window size),
+    instead of allocating a padded array and then returning a strided view of it.
+
+    Parameters
+    ----------
+    arr : numpy.ndarray
+        with 1 or 2 dimensions, e.g. a vector of labeled timebins
+        or a spectrogram.
+    window_size : int
+        width of window in number of elements.
+    padval : float
+        value to pad with. Added to end of array, the
+        "right side" if 2-dimensional.
+    return_padding_mask : bool
+        if True, return a boolean vector to use for cropping
+        back down to size before padding.
+
+    Returns
+    -------
+    batch_windows : numpy.ndarray
+        with shape (batch size, window_size) if array is 1d,
+        or with shape (batch size, height, window_size) if array is 2d.
+        Has the same dtype as ``arr``, unless
+        ``padval`` requires a different dtype.
+    padding_mask : numpy.ndarray
+        Boolean vector with size equal to width of padded array,
+        i.e. batch size * window size.
+        Has values of ``True`` where columns
+        are from the original array, and values of ``False``
+        where columns were added for padding.
+        Only returned if ``return_padding_mask`` is ``True``.
+    """
+    if arr.ndim not in (1, 2):
+        raise ValueError(
+            f"input array must be 1d or 2d but number of dimensions was: {arr.ndim}"
+        )
+
+    width = arr.shape[-1]
+    n_windows = -(-width // window_size)  # ceiling division
+    # number of windows that are filled completely by ``arr``, and width of the last partial window
+    n_full = width // window_size
+    remainder = width - n_full * window_size
+    dtype = np.result_type(arr.dtype, padval)
+
+    if arr.ndim == 1:
+        batch_windows = np.empty((n_windows, window_size), dtype=dtype)
+        # windows are contiguous, so we can treat them as one padded vector
+        padded = batch_windows.reshape(-1)
+        padded[:width] = arr
+        padded[width:] = padval
+    elif arr.ndim == 2:
+        height = arr.shape[0]
+        batch_windows = np.empty((n_windows, height, window_size), dtype=dtype)
+        if n_full > 0:
+            batch_windows[:n_full] = (
+                arr[:, : n_full * window_size]
+                .reshape(height, n_full, window_size)
+                .transpose(1, 0, 2)
+            )
+        if remainder > 0:
+            batch_windows[n_full, :, :remainder] = arr[:, n_full * window_size :]
+            batch_windows[n_full, :, remainder:] = padval
+
+    if return_padding_mask:
+        padding_mask = np.zeros((n_windows * window_size,), dtype=bool)
+        padding_mask[:width] = True
+        return batch_windows, padding_mask
+    else:
+        return batch_windows
+
+
 def view_as_window_batch(arr, window_width):
     """return view of a 1d or 2d array as a batch of non-overlapping windows
 
@@ -117,48 +329,103 @@ def view_as_window_batch(arr, window_width):
         with shape (batch size, window_size) if array is 1d,
         or with shape (batch size, height, window_size) if array is 2d.
         Batch size will be arr.shape[-1] // window_width.
+        Dimensions of size 1 are not removed, so the number of dimensions
+        of the returned array does not depend on the shape of ``arr``.
         Window width must divide arr.shape[-1] evenly.
         To pad the array so it can be divided into windows of the specified
-        width, use the `pad_to_window` transform
-
-    Notes
-    -----
-    adapted from skimage.util.view_as_blocks
-    https://github.com/scikit-image/scikit-image/blob/f1b7cf60fb80822849129cb76269b75b8ef18db1/skimage/util/shape.py#L9
+        width, use the `pad_to_window` transform.
+        If ``arr`` is C-contiguous, e.g. as returned by `pad_to_window`,
+        this is a view of ``arr``, not a copy.
     """
     if not isinstance(window_width, int) or window_width < 1:
         raise ValueError(f"`window_width` must be a positive integer, but was: {window_width}")
 
-    if arr.ndim == 1:
-        window_shape = (window_width,)
-    elif arr.ndim == 2:
-        height, _ = arr.shape
-        window_shape = (height, window_width)
-    else:
+    if arr.ndim not in _VIEW_AS_WINDOW_BATCH_BY_NDIM:
         raise ValueError(
             f"input array must be 1d or 2d but number of dimensions was: {arr.ndim}"
         )
 
-    window_shape = np.array(window_shape)
-    arr_shape = np.array(arr.shape)
-    if (arr_shape % window_shape).sum() != 0:
+    # specialized functions check that ``window_width`` divides evenly into width of ``arr``
+    return _VIEW_AS_WINDOW_BATCH_BY_NDIM[arr.ndim](arr, window_width)
+
+
+def view_as_window_batch_torch(tensor, window_width):
+    """return view of a 1d or 2d tensor as a batch of non-overlapping windows.
+
+    Torch version of :func:`view_as_window_batch`,
+    that uses :meth:`torch.Tensor.unfold` to return a view of the tensor,
+    so it does not need to be converted to or from a numpy array.
+
+    Parameters
+    ----------
+    tensor : torch.Tensor
+        with 1 or 2 dimensions, e.g. a vector of labeled timebins
+        or a 2-d tensor representing a spectrogram.
+    window_width : int
+        width of window in number of elements.
+
+    Returns
+    -------
+    batch_windows : torch.Tensor
+        with shape (batch size, window_size) if tensor is 1d,
+        or with shape (batch size, height, window_size) if tensor is 2d.
+        Batch size will be tensor.shape[-1] // window_width.
+        Window width must divide tensor.shape[-1] evenly.
+        This is a view of ``tensor``, that will not be contiguous if ``tensor`` is 2d.
+    """
+    if not isinstance(window_width, int) or window_width < 1:
+        raise ValueError(f"`window_width` must be a positive integer, but was: {window_width}")
+    if tensor.ndim not in (1, 2):
         raise ValueError(
-            "'window_width' does not divide evenly into with 'arr' shape. "
+            f"input tensor must be 1d or 2d but number of dimensions was: {tensor.ndim}"
+        )
+    # ``unfold`` would silently drop any elements left over after the last window
+    if tensor.shape[-1] % window_width != 0:
+        raise ValueError(
+            "'window_width' does not divide evenly into with 'tensor' shape. "
             "Use 'pad_to_window' transform to pad array so it can be windowed."
         )
 
-    new_shape = tuple(arr_shape // window_shape) + tuple(window_shape)
-    new_strides = tuple(arr.strides * window_shape) + arr.strides
-    batch_windows = np.lib.stride_tricks.as_strided(
-        arr, shape=new_shape, strides=new_strides
-    )
-    # when 2d, first dim 1 because new shape has height equal to original arr
-    if batch_windows.ndim == 4 and batch_windows.shape[0] == 1:
-        # we don't want that extra dim of size 1, we want first dim to be "batch"
-        batch_windows = np.squeeze(batch_windows)
+    batch_windows = tensor.unfold(-1, window_width, window_width)
+    if tensor.ndim == 2:
+        # (height, windows, window width) -> (windows, height, window width)
+        batch_windows = batch_windows.permute(1, 0, 2)
     return batch_windows
 
 
+# below, versions of ``view_as_window_batch`` specialized for 1-d and 2-d arrays.
+# Callers that know the number of dimensions ahead of time, e.g. the ``ViewAsWindowBatch`` transform,
+# can use these directly, so they don't check dimensions every call.
+# Reshape + transpose gives us a view with the correct strides,
+# without computing strides by hand with ``as_strided``
+def _view_as_window_batch_1d(arr, window_width):
+    n_windows, remainder = divmod(arr.shape[0], window_width)
+    if remainder:
+        raise ValueError(
+            "'window_width' does not divide evenly into with 'arr' shape. "
+            "Use 'pad_to_window' transform to pad array so it can be windowed."
+        )
+    return arr.reshape(n_windows, window_width)
+
+
+def _view_as_window_batch_2d(arr, window_width):
+    height, width = arr.shape
+    n_windows, remainder = divmod(width, window_width)
+    if remainder:
+        raise ValueError(
+            "'window_width' does not divide evenly into with 'arr' shape. "
+            "Use 'pad_to_window' transform to pad array so it can be windowed."
+        )
+    # (height, width) -> (height, windows, window width) -> (windows, height, window width)
+    return arr.reshape(height, n_windows, window_width).transpose(1, 0, 2)
+
+
+_VIEW_AS_WINDOW_BATCH_BY_NDIM = {
+    1: _view_as_window_batch_1d,
+    2: _view_as_window_batch_2d,
+}
+
+
 def to_floattensor(arr):
     """convert Numpy array to torch.FloatTensor.
 
@@ -169,9 +436,16 @@ def to_floattensor(arr):
     Returns
     -------
     float_tensor
-        with dtype 'float32'
+        with dtype 'float32'.
+        If ``arr`` already has dtype float32,
+        the tensor shares memory with ``arr``,
+        otherwise it is a converted copy.
     """
-    return torch.from_numpy(arr).float()
+    tensor = torch.from_numpy(arr)
+    if tensor.dtype == torch.float32:
+        # no need to convert; ``torch.from_numpy`` does not copy
+        return tensor
+    return tensor.float()
 
 
 def to_longtensor(arr):
@@ -184,9 +458,16 @@ def to_longtensor(arr):
     Returns
     -------
     long_tensor : torch.Tensor
-        with dtype 'float64'
+        with dtype 'int64'.
+        If ``arr`` already has dtype int64,
+        the tensor shares memory with ``arr``,
+        otherwise it is a converted copy.
     """
-    return torch.from_numpy(arr).long()
+    tensor = torch.from_numpy(arr)
+    if tensor.dtype == torch.int64:
+        # no need to convert; ``torch.from_numpy`` does not copy
+        return tensor
+    return tensor.long()
 
 
 def add_channel(input, channel_dim=0):
@@ -2,12 +2,14 @@ import pathlib
 
 import numpy as np
 import pandas as pd
+import torch
 
 from ..common.validators import column_or_1d
 from . import functional as F
 
 __all__ = [
     "AddChannel",
+    "PadAndWindow",
     "PadToWindow",
     "StandardizeSpect",
     "ToFloatTensor",
@@ -72,6 +74,12 @@ class StandardizeSpect:
         self.mean_freqs = mean_freqs
         self.std_freqs = std_freqs
         self.non_zero_std = non_zero_std
+        # compute reciprocal of std. dev. once here,
+        # so standardizing is just a subtraction and a multiplication
+        if std_freqs is not None:
+            self._inv_std = F._inv_std(std_freqs, non_zero_std)
+        else:
+            self._inv_std = None
 
     @classmethod
     def fit_dataset_path(cls, dataset_path, split="train"):
@@ -144,19 +152,28 @@ class StandardizeSpect:
         non_zero_std = np.argwhere(std_freqs != 0)
         return cls(mean_freqs, std_freqs, non_zero_std)
 
+    def __getstate__(self):
+        # don't pickle tensors cached for each dtype and device,
+        # e.g. when the scaler is saved with joblib, or sent to DataLoader worker processes
+        state = self.__dict__.copy()
+        state["_tensors"] = None
+        return state
+
     def __call__(self, spect):
         """normalizes input spectrogram with fit parameters.
 
         Parameters
         ----------
-        spect : numpy.ndarray
+        spect : numpy.ndarray, torch.Tensor
             2-d array with dimensions (frequency bins, time bins).
+            If a tensor, can also be a batch,
+            with dimensions (..., frequency bins, time bins).
 
         Returns
         -------
-        z_norm_spect : numpy.ndarray
+        z_norm_spect : numpy.ndarray, torch.Tensor
             array standardized to same scale as set of spectrograms that
-            SpectScaler was fit with
+            SpectScaler was fit with. Same type as ``spect``.
         """
         if any(
             [not hasattr(self, attr) for attr in ["mean_freqs", "std_freqs"]]
@@ -168,9 +185,39 @@ class StandardizeSpect:
                 "transform"
             )
 
+        if getattr(self, "_inv_std", None) is None:
+            # e.g., an instance saved with an earlier version of vak, then loaded with joblib
+            self._inv_std = F._inv_std(self.std_freqs, self.non_zero_std)
+
+        if isinstance(spect, torch.Tensor):
+            if spect.shape[-2] != self.mean_freqs.shape[0]:
+                raise ValueError(
+                    f"number of frequency bins in spect, {spect.shape[-2]}, "
+                    f"does not match number of elements in self.mean_freqs, {self.mean_freqs.shape[0]},"
+                    "i.e. the number of frequency bins from the spectrogram"
+                    "to which the scaler was fit originally"
+                )
+            if getattr(self, "_tensors", None) is None:
+                self._tensors = {}
+            key = (spect.dtype, spect.device)
+            if key not in self._tensors:
+                # convert once per dtype and device, so we don't make new tensors for every call
+                self._tensors[key] = (
+                    torch.from_numpy(self.mean_freqs).to(
+                        device=spect.device, dtype=spect.dtype
+                    ),
+                    torch.from_numpy(self._inv_std).to(
+                        device=spect.device, dtype=spect.dtype
+                    ),
+                )
+            mean_freqs_tensor, inv_std_tensor = self._tensors[key]
+            return F.standardize_spect_torch(
+                spect, mean_freqs_tensor, inv_std_tensor
+            )
+
         if not isinstance(spect, np.ndarray):
             raise TypeError(
-                f"type of spect must be numpy.ndarray but was: {type(spect)}"
+                f"type of spect must be numpy.ndarray or torch.Tensor but was: {type(spect)}"
             )
 
         if spect.shape[0] != self.mean_freqs.shape[0]:
@@ -182,7 +229,11 @@ class StandardizeSpect:
             )
 
         return F.standardize_spect(
-            spect, self.mean_freqs, self.std_freqs, self.non_zero_std
+            spect,
+            self.mean_freqs,
+            self.std_freqs,
+            self.non_zero_std,
+            inv_std=self._inv_std,
         )
 
     def __repr__(self):
@@ -262,7 +313,7 @@ class ViewAsWindowBatch:
 
     Parameters
     ----------
-    arr : numpy.ndarray
+    arr : numpy.ndarray, torch.Tensor
         with 1 or 2 dimensions, e.g. a vector of labeled timebins
         or a 2-d array representing a spectrogram.
         If the array has 2-d dimensions, the returned array will
@@ -272,18 +323,14 @@ class ViewAsWindowBatch:
 
     Returns
     -------
-    batch_windows : numpy.ndarray
+    batch_windows : numpy.ndarray, torch.Tensor
+        Same type as ``arr``.
         with shape (batch size, window_width) if array is 1d,
         or with shape (batch size, height, window_width) if array is 2d.
         Batch size will be arr.shape[-1] // window_width.
         Window width must divide arr.shape[-1] evenly.
         To pad the array so it can be divided into windows of the specified
         width, use the `pad_to_window` transform
-
-    Notes
-    -----
-    adapted from skimage.util.view_as_blocks
-    https://github.com/scikit-image/scikit-image/blob/f1b7cf60fb80822849129cb76269b75b8ef18db1/skimage/util/shape.py#L9
     """
 
     def __init__(self, window_width: int | float):
@@ -296,15 +343,94 @@ class ViewAsWindowBatch:
             )
 
         self.window_width = window_width
+        # function specialized for number of dimensions of input,
+        # chosen the first time the transform is called
+        self._view_fn = None
+        self._view_fn_ndim = None
 
     def __call__(self, arr):
-        return F.view_as_window_batch(arr, self.window_width)
+        if isinstance(arr, torch.Tensor):
+            return F.view_as_window_batch_torch(arr, self.window_width)
+
+        if arr.ndim != self._view_fn_ndim:
+            if arr.ndim not in F._VIEW_AS_WINDOW_BATCH_BY_NDIM:
+                raise ValueError(
+                    f"input array must be 1d or 2d but number of dimensions was: {arr.ndim}"
+                )
+            self._view_fn = F._VIEW_AS_WINDOW_BATCH_BY_NDIM[arr.ndim]
+            self._view_fn_ndim = arr.ndim
+        return self._view_fn(arr, self.window_width)
 
     def __repr__(self):
         args = f"(window_width={self.window_width})"
         return self.__class__.__name__ + args
 
 
+class PadAndWindow:
+    """pad a 1d or 2d array and return it as a batch of non-overlapping windows.
+
+    Equivalent to applying :class:`PadToWindow` and then :class:`ViewAsWindowBatch`,
+    but returns a contiguous array instead of a view of a padded copy.
+
+    Parameters
+    ----------
+    arr : numpy.ndarray
+        with 1 or 2 dimensions, e.g. a vector of labeled timebins
+        or a spectrogram.
+    window_size : int
+        width of window in number of elements.
+    padval : float
+        value to pad with. Added to end of array, the
+        "right side" if 2-dimensional.
+    return_padding_mask : bool
+        if True, return a boolean vector to use for cropping
+        back down to size before padding.
+
+    Returns
+    -------
+    batch_windows : numpy.ndarray
+        with shape (batch size, window_size) if array is 1d,
+        or with shape (batch size, height, window_size) if array is 2d.
+    padding_mask : np.bool
+        has size equal to batch size * window size.
+        Has values of 1 where columns are from the original array,
+        and values of 0 where columns were added for padding.
+        Only returned if return_padding_mask is True.
+    """
+
+    def __init__(self, window_size, padval=0.0, return_padding_mask=True):
+        if not isinstance(window_size, int) or (
+            isinstance(window_size, float) and window_size.is_integer() is False
+        ):
+            raise ValueError(
+                f"window size must be an int or a whole number float;"
+                f" type was {type(window_size)} and value was {window_size}"
+            )
+
+        if type(padval) not in (int, float):
+            raise TypeError(
+                f"type for padval must be int or float but was: {type(padval)}"
+            )
+        if not isinstance(return_padding_mask, bool):
+            raise TypeError(
+                "return_padding_mask must be boolean (True or False), "
+                f"but was type {type(return_padding_mask)} with value {return_padding_mask}"
+            )
+
+        self.window_size = window_size
+        self.padval = padval
+        self.return_padding_mask = return_padding_mask
+
+    def __call__(self, arr):
+        return F.pad_and_window(
+            arr, self.window_size, self.padval, self.return_padding_mask
+        )
+
+    def __repr__(self):
+        args = f"(window_size={self.window_size}, padval={self.padval}, return_padding_mask={self.return_padding_mask})"
+        return self.__class__.__name__ + args
+
+
 class ToFloatTensor:
     """convert Numpy array to torch.FloatTensor.
 
@@ -338,7 +464,7 @@ class ToLongTensor:
     Returns
     -------
     long_tensor : torch.Tensor
-        with dtype 'float64'
+        with dtype 'int64'
     """
 
     def __init__(self):
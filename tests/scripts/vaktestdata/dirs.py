@@ -24,14 +24,13 @@ def make_subdirs_in_generated(config_paths):
         "Making sub-directories in ./tests/data_for_tests/generated/ where files generated by `vak` will go"
     )
 
+    # first collect all the sub-directories we need, so we make each one only once,
+    # even when configs share a directory
+    subdirs_to_make = set()
     for top_level_dir in constants.TOP_LEVEL_DIRS:  # datasets / results
-        subdir_to_make = (
+        subdirs_to_make.add(
                 constants.GENERATED_TEST_DATA / top_level_dir
         )
-        logger.info(
-            f"Making sub-directory: {subdir_to_make}"
-        )
-        subdir_to_make.mkdir(parents=True)
 
     for config_metadata in constants.CONFIG_METADATA:
         config_type = config_metadata.config_type  # train, eval, predict, etc.
@@ -46,18 +45,17 @@ def make_subdirs_in_generated(config_paths):
         model = config_metadata.model
 
         if config_metadata.use_dataset_from_config is None:  # we need to make dataset dir
-            subdir_to_make = (
+            subdirs_to_make.add(
                     constants.GENERATED_TEST_DATA / 'prep' / config_type / data_dir / model
             )
-            logger.info(
-                f"Making sub-directory: {subdir_to_make}"
-            )
-            subdir_to_make.mkdir(parents=True)
 
-        subdir_to_make = (
+        subdirs_to_make.add(
                 constants.GENERATED_TEST_DATA / 'results' / config_type / data_dir / model
         )
+
+    # sort so parents are made before their sub-directories
+    for subdir_to_make in sorted(subdirs_to_make, key=lambda subdir: (len(subdir.parts), subdir)):
         logger.info(
             f"Making sub-directory: {subdir_to_make}"
         )
-        subdir_to_make.mkdir(parents=True)
+        subdir_to_make.mkdir(parents=True, exist_ok=True)
@@ -2,7 +2,9 @@
 import itertools
 import pathlib
 
+import numpy as np
 import pytest
+import scipy.io
 
 import vak.common.files
 from vak.common.constants import VALID_AUDIO_FORMATS
@@ -77,3 +79,122 @@ def test_find_audio_fname_with_mat(spect_path, audio_ext, spect_ext):
     # make sure it's some valid audio format
     assert pathlib.Path(out).suffix.replace(".", "") in VALID_AUDIO_FORMATS
     assert out == expected
+
+
+def _make_spect_file(dir_path, name, spect_format, n_freqbins=5, n_timebins=10,
+                     timebin_dur=0.002, freq_bins=None, spect_key='s', time_bins=None):
+    """make a small synthetic spectrogram file, for testing validation"""
+    if freq_bins is None:
+        freq_bins = np.linspace(0., 10000., n_freqbins)
+    if time_bins is None:
+        time_bins = np.arange(n_timebins) * timebin_dur
+    spect_dict = {
+        spect_key: np.random.rand(n_freqbins, n_timebins),
+        'f': freq_bins,
+        't': time_bins,
+    }
+    spect_path = dir_path / f'{name}.{spect_format}'
+    if spect_format == 'npz':
+        np.savez(spect_path, **spect_dict)
+    elif spect_format == 'mat':
+        scipy.io.savemat(spect_path, spect_dict)
+    return spect_path
+
+
+@pytest.mark.parametrize('spect_format', ['npz', 'mat'])
+def test_is_valid_set_of_spect_files(spect_format, tmp_path):
+    spect_paths = [
+        _make_spect_file(tmp_path, f'spect{ind}', spect_format)
+        for ind in range(3)
+    ]
+    assert vak.common.files.spect.is_valid_set_of_spect_files(spect_paths, spect_format) is True
+
+
+@pytest.mark.parametrize('spect_format', ['npz', 'mat'])
+def test_is_valid_set_of_spect_files_mismatched_freqbins_raises(spect_format, tmp_path):
+    spect_paths = [
+        _make_spect_file(tmp_path, 'spect0', spect_format),
+        _make_spect_file(tmp_path, 'spect1', spect_format, freq_bins=np.linspace(0., 8000., 5)),
+    ]
+    with pytest.raises(ValueError, match='Frequency bins'):
+        vak.common.files.spect.is_valid_set_of_spect_files(spect_paths, spect_format)
+
+
+@pytest.mark.parametrize('spect_format', ['npz', 'mat'])
+def test_is_valid_set_of_spect_files_mismatched_timebin_dur_raises(spect_format, tmp_path):
+    spect_paths = [
+        _make_spect_file(tmp_path, 'spect0', spect_format, timebin_dur=0.002),
+        _make_spect_file(tmp_path, 'spect1', spect_format, timebin_dur=0.001),
+    ]
+    with pytest.raises(ValueError, match='Duration of time bins'):
+        vak.common.files.spect.is_valid_set_of_spect_files(spect_paths, spect_format)
+
+
+@pytest.mark.parametrize('spect_format', ['npz', 'mat'])
+def test_is_valid_set_of_spect_files_missing_spect_key_raises(spect_format, tmp_path):
+    spect_paths = [
+        _make_spect_file(tmp_path, 'spect0', spect_format, spect_key='S'),
+    ]
+    with pytest.raises(KeyError):
+        vak.common.files.spect.is_valid_set_of_spect_files(spect_paths, spect_format)
+
+
+@pytest.mark.parametrize(
+    'spect_format, bins_kwargs, match',
+    [
+        ('npz', {'freq_bins': np.linspace(0., 10000., 4)}, 'frequency bins'),
+        ('mat', {'freq_bins': np.linspace(0., 10000., 4)}, 'frequency bins'),
+        ('npz', {'time_bins': np.arange(9) * 0.002}, 'time_bins'),
+        ('mat', {'time_bins': np.arange(9) * 0.002}, 'time_bins'),
+    ]
+)
+def test_is_valid_set_of_spect_files_bins_length_mismatch_raises(spect_format, bins_kwargs, match, tmp_path):
+    spect_paths = [
+        _make_spect_file(tmp_path, 'spect0', spect_format, **bins_kwargs),
+    ]
+    with pytest.raises(ValueError, match=match):
+        vak.common.files.spect.is_valid_set_of_spect_files(spect_paths, spect_format)
+
+
+def test_is_valid_set_of_spect_files_empty_raises():
+    with pytest.raises(ValueError):
+        vak.common.files.spect.is_valid_set_of_spect_files([], 'npz')
+
+
+@pytest.mark.parametrize(
+    'savez, key',
+    [
+        (np.savez, 's'),
+        (np.savez, 'f'),
+        (np.savez_compressed, 's'),
+        (np.savez_compressed, 'f'),
+    ]
+)
+def test__npz_shape(savez, key, tmp_path):
+    npz_path = tmp_path / 'spect.npz'
+    savez(npz_path, s=np.random.rand(5, 10), f=np.linspace(0., 10000., 5))
+
+    shape = vak.common.files.spect._npz_shape(npz_path, key)
+
+    with np.load(npz_path) as npz:
+        assert shape == npz[key].shape
+
+
+@pytest.mark.parametrize('savez', [np.savez, np.savez_compressed])
+def test__npz_shape_missing_key_returns_none(savez, tmp_path):
+    npz_path = tmp_path / 'spect.npz'
+    savez(npz_path, s=np.random.rand(5, 10))
+
+    assert vak.common.files.spect._npz_shape(npz_path, 'S') is None
+
+
+@pytest.mark.parametrize('spect_format', ['npz', 'mat'])
+def test__validate_set_of_spect_files_returns_timebin_dur(spect_format, tmp_path):
+    spect_paths = [
+        _make_spect_file(tmp_path, f'spect{ind}', spect_format)
+        for ind in range(3)
+    ]
+
+    timebin_dur = vak.common.files.spect._validate_set_of_spect_files(spect_paths, spect_format)
+
+    assert timebin_dur == vak.common.files.spect.timebin_dur(spect_paths[0], spect_format, 't', 5)
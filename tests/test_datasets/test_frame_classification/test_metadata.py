@@ -0,0 +1,32 @@
+import json
+import os
+
+import vak.datasets.frame_classification
+
+
+class TestMetadata:
+    def test_from_path_cached(self, tmp_path):
+        metadata_json_path = tmp_path / vak.datasets.frame_classification.Metadata.METADATA_JSON_FILENAME
+        metadata_json_path.write_text(json.dumps({
+            'dataset_csv_filename': 'bird1_prep_230319_115852.csv',
+            'input_type': 'spect',
+            'frame_dur': 0.002,
+        }))
+
+        metadata = vak.datasets.frame_classification.Metadata.from_path(metadata_json_path)
+        # repeat call returns the same instance
+        assert vak.datasets.frame_classification.Metadata.from_path(metadata_json_path) is metadata
+
+        # re-write file, and keep the same modification time,
+        # like a file system that only records time in steps of seconds
+        mtime_ns = metadata_json_path.stat().st_mtime_ns
+        metadata_json_path.write_text(json.dumps({
+            'dataset_csv_filename': 'bird1_prep_230319_115852.csv',
+            'input_type': 'spect',
+            'frame_dur': 0.0027,
+        }))
+        os.utime(metadata_json_path, ns=(mtime_ns, mtime_ns))
+
+        metadata_rewritten = vak.datasets.frame_classification.Metadata.from_path(metadata_json_path)
+        assert metadata_rewritten is not metadata
+        assert metadata_rewritten.frame_dur == 0.0027
@@ -0,0 +1,30 @@
+import json
+import os
+
+import vak.datasets.parametric_umap
+
+
+class TestMetadata:
+    def test_from_path_cached(self, tmp_path):
+        metadata_json_path = tmp_path / vak.datasets.parametric_umap.Metadata.METADATA_JSON_FILENAME
+        metadata_json_path.write_text(json.dumps({
+            'dataset_csv_filename': 'bird1_prep_230319_115852.csv',
+            'shape': [32, 32],
+        }))
+
+        metadata = vak.datasets.parametric_umap.Metadata.from_path(metadata_json_path)
+        # repeat call returns the same instance
+        assert vak.datasets.parametric_umap.Metadata.from_path(metadata_json_path) is metadata
+
+        # re-write file, and keep the same modification time,
+        # like a file system that only records time in steps of seconds
+        mtime_ns = metadata_json_path.stat().st_mtime_ns
+        metadata_json_path.write_text(json.dumps({
+            'dataset_csv_filename': 'bird1_prep_230319_115852.csv',
+            'shape': [128, 128],
+        }))
+        os.utime(metadata_json_path, ns=(mtime_ns, mtime_ns))
+
+        metadata_rewritten = vak.datasets.parametric_umap.Metadata.from_path(metadata_json_path)
+        assert metadata_rewritten is not metadata
+        assert metadata_rewritten.shape == (128, 128)
@@ -1,5 +1,8 @@
+import pickle
+
 import numpy as np
 import pytest
+import torch
 
 import vak.transforms
 import vak.transforms.functional
@@ -42,6 +45,79 @@ class TestStandardizeSpect:
             np.equal(spect_out, expected)
         )
 
+    def test_standardize_spect_out(self):
+        spect = np.random.rand(5, 100)
+        std_freqs = np.std(spect, axis=1)
+        std_freqs[2] = 0.
+        mean_freqs = np.mean(spect, axis=1)
+        non_zero_std = np.argwhere(std_freqs != 0)
+
+        expected = spect - mean_freqs[:, np.newaxis]
+        expected[non_zero_std, :] = expected[non_zero_std, :] / std_freqs[non_zero_std, np.newaxis]
+
+        out = np.empty_like(spect)
+        spect_out = vak.transforms.functional.standardize_spect(
+            spect, mean_freqs, std_freqs, non_zero_std, out=out
+        )
+        assert spect_out is out
+        assert np.allclose(spect_out, expected)
+
+    @pytest.mark.parametrize(
+        'n_freqs',
+        [
+            5,
+            20,
+        ]
+    )
+    def test_standardize_spect_wrong_length_mean_std_raises(self, n_freqs):
+        spect = np.random.rand(10, 20)
+        mean_freqs = np.zeros(n_freqs)
+        std_freqs = np.ones(n_freqs)
+        non_zero_std = np.arange(n_freqs)
+        with pytest.raises(ValueError):
+            vak.transforms.functional.standardize_spect(
+                spect, mean_freqs, std_freqs, non_zero_std
+            )
+
+    @pytest.mark.parametrize(
+        'spect_dtype, mean_std_dtype',
+        [
+            ('>f4', np.float64),
+            ('>f8', np.float64),
+            (np.float16, np.float64),
+            (np.float64, '>f8'),
+        ]
+    )
+    def test_standardize_spect_non_kernel_dtype(self, spect_dtype, mean_std_dtype):
+        spect = np.random.rand(5, 100)
+        std_freqs = np.std(spect, axis=1)
+        mean_freqs = np.mean(spect, axis=1)
+        non_zero_std = np.argwhere(std_freqs != 0)
+
+        spect = spect.astype(spect_dtype)
+        mean_freqs = mean_freqs.astype(mean_std_dtype)
+        std_freqs = std_freqs.astype(mean_std_dtype)
+        expected = (
+            (spect - mean_freqs[:, np.newaxis]) / std_freqs[:, np.newaxis]
+        )
+
+        spect_out = vak.transforms.functional.standardize_spect(
+            spect, mean_freqs, std_freqs, non_zero_std
+        )
+        assert spect_out.dtype == expected.dtype
+        assert np.allclose(spect_out, expected)
+
+    def test_standardize_spect_wrong_shape_out_raises(self):
+        spect = np.random.rand(10, 20)
+        mean_freqs = np.zeros(10)
+        std_freqs = np.ones(10)
+        non_zero_std = np.arange(10)
+        out = np.empty((2, 3))
+        with pytest.raises(ValueError):
+            vak.transforms.functional.standardize_spect(
+                spect, mean_freqs, std_freqs, non_zero_std, out=out
+            )
+
     @pytest.mark.parametrize(
         'split',
         [
@@ -128,3 +204,220 @@ class TestStandardizeSpect:
             assert np.all(
                 np.equal(attr, expected)
             )
+
+    def test_standardize_spect_tensor(self):
+        spect = np.random.rand(5, 100)
+        standardizer = vak.transforms.StandardizeSpect.fit(spect)
+        expected = standardizer(spect.copy())
+
+        spect_out = standardizer(torch.from_numpy(spect))
+        assert isinstance(spect_out, torch.Tensor)
+        assert np.allclose(spect_out.numpy(), expected)
+
+    @pytest.mark.parametrize('dtype', [torch.float32, torch.float64])
+    def test_standardize_spect_tensor_cache(self, dtype):
+        spect = np.random.rand(5, 100)
+        standardizer = vak.transforms.StandardizeSpect.fit(spect)
+        expected = standardizer(spect.copy())
+
+        spect_tensor = torch.from_numpy(spect).to(dtype)
+        spect_out = standardizer(spect_tensor)
+        assert spect_out.dtype == dtype
+        assert np.allclose(spect_out.numpy(), expected, atol=1e-5)
+
+        mean_freqs_tensor, inv_std_tensor = standardizer._tensors[(dtype, spect_tensor.device)]
+        assert mean_freqs_tensor.dtype == dtype
+        assert inv_std_tensor.dtype == dtype
+        # cached tensors are re-used on the next call
+        standardizer(spect_tensor)
+        assert standardizer._tensors[(dtype, spect_tensor.device)][0] is mean_freqs_tensor
+
+        # cached tensors are not pickled
+        assert pickle.loads(pickle.dumps(standardizer))._tensors is None
+
+
+class TestPadToWindow:
+
+    @pytest.mark.parametrize(
+        'dtype, padval, expected_dtype',
+        [
+            (np.float32, 0., np.float32),
+            (np.float64, 0., np.float64),
+            (np.int64, 0, np.int64),
+            # float padval can't be represented by int, so we get float
+            (np.int64, 0.5, np.float64),
+        ]
+    )
+    def test_dtype(self, dtype, padval, expected_dtype):
+        arr = np.random.rand(5, 10).astype(dtype)
+
+        for transform in (
+            vak.transforms.PadToWindow(window_size=4, padval=padval),
+            vak.transforms.PadAndWindow(window_size=4, padval=padval),
+        ):
+            out, _ = transform(arr)
+            assert out.dtype == expected_dtype
+
+    def test_pad_to_window_out(self):
+        spect = np.random.rand(3, 10)
+        out = np.empty((3, 12))
+        padding_mask_out = np.empty((12,), dtype=bool)
+
+        padded, padding_mask = vak.transforms.functional.pad_to_window(
+            spect, window_size=4, out=out, padding_mask_out=padding_mask_out
+        )
+        assert padded is out
+        assert padding_mask is padding_mask_out
+        assert np.array_equal(padded[:, :10], spect)
+        assert np.all(padded[:, 10:] == 0.)
+        assert padding_mask.sum() == 10
+
+
+class TestViewAsWindowBatch:
+
+    @pytest.mark.parametrize(
+        'shape, window_width, expected_shape',
+        [
+            ((100,), 10, (10, 10)),
+            ((5, 100), 10, (10, 5, 10)),
+            # shape is always (batch, height, window width), even when dimensions have size 1
+            ((5, 10), 10, (1, 5, 10)),
+            ((1, 100), 10, (10, 1, 10)),
+        ]
+    )
+    def test_view_as_window_batch(self, shape, window_width, expected_shape):
+        arr = np.random.rand(*shape)
+        view_as_window_batch = vak.transforms.ViewAsWindowBatch(window_width)
+
+        batch_windows = view_as_window_batch(arr)
+
+        assert batch_windows.shape == expected_shape
+        assert np.shares_memory(batch_windows, arr)
+        for window_ind, window in enumerate(batch_windows):
+            assert np.array_equal(
+                window, arr[..., window_ind * window_width: (window_ind + 1) * window_width]
+            )
+
+    @pytest.mark.parametrize(
+        'shape, window_width, expected_shape',
+        [
+            ((100,), 10, (10, 10)),
+            ((5, 100), 10, (10, 5, 10)),
+            ((5, 10), 10, (1, 5, 10)),
+        ]
+    )
+    def test_view_as_window_batch_tensor(self, shape, window_width, expected_shape):
+        arr = np.random.rand(*shape)
+        view_as_window_batch = vak.transforms.ViewAsWindowBatch(window_width)
+
+        batch_windows = view_as_window_batch(torch.from_numpy(arr))
+
+        assert isinstance(batch_windows, torch.Tensor)
+        assert batch_windows.shape == expected_shape
+        assert np.array_equal(batch_windows.numpy(), view_as_window_batch(arr))
+
+
+class TestPadAndWindow:
+
+    @pytest.mark.parametrize(
+        'shape, window_size',
+        [
+            ((100,), 10),
+            ((95,), 10),
+            ((5, 100), 10),
+            ((5, 95), 10),
+            ((5, 7), 10),
+        ]
+    )
+    def test_pad_and_window(self, shape, window_size):
+        arr = np.random.rand(*shape)
+        pad_and_window = vak.transforms.PadAndWindow(window_size, padval=-1.)
+
+        batch_windows, padding_mask = pad_and_window(arr)
+
+        padded, expected_padding_mask = vak.transforms.functional.pad_to_window(
+            arr, window_size, padval=-1.
+        )
+        n_windows = padded.shape[-1] // window_size
+        if arr.ndim == 1:
+            expected_batch_windows = padded.reshape(n_windows, window_size)
+        else:
+            expected_batch_windows = padded.reshape(
+                shape[0], n_windows, window_size
+            ).transpose(1, 0, 2)
+        assert batch_windows.flags.c_contiguous
+        assert np.array_equal(batch_windows, expected_batch_windows)
+        assert np.array_equal(padding_mask, expected_padding_mask)
+
+
+class TestStandardizeSpectTorch:
+
+    def test_standardize_spect_torch(self):
+        spect = np.random.rand(5, 100)
+        standardizer = vak.transforms.StandardizeSpect.fit(spect)
+        expected = standardizer(spect.copy())
+
+        batch = torch.from_numpy(np.stack([spect, spect]))
+        standardized = vak.transforms.functional.standardize_spect_torch(
+            batch,
+            torch.from_numpy(standardizer.mean_freqs),
+            torch.from_numpy(standardizer._inv_std),
+        )
+        for spect_standardized in standardized:
+            assert np.allclose(spect_standardized.numpy(), expected)
+
+
+class TestToTensor:
+
+    @pytest.mark.parametrize(
+        'transform_class, dtype, other_dtype, expected_torch_dtype',
+        [
+            (vak.transforms.ToFloatTensor, np.float32, np.float64, torch.float32),
+            (vak.transforms.ToLongTensor, np.int64, np.int32, torch.int64),
+        ]
+    )
+    def test_to_tensor(self, transform_class, dtype, other_dtype, expected_torch_dtype):
+        transform = transform_class()
+
+        arr = np.arange(10).astype(dtype)
+        tensor = transform(arr)
+        assert tensor.dtype == expected_torch_dtype
+        # no copy when dtype already matches
+        assert np.shares_memory(tensor.numpy(), arr)
+
+        arr = np.arange(10).astype(other_dtype)
+        tensor = transform(arr)
+        assert tensor.dtype == expected_torch_dtype
+        assert np.array_equal(tensor.numpy(), arr)
+
+
+class TestStandardizeSpectCollate:
+
+    def test_standardize_spect_collate(self):
+        n_freqs, window_size, batch_size = 5, 20, 4
+        standardizer = vak.transforms.StandardizeSpect.fit(np.random.rand(n_freqs, 100))
+        collate_fn = vak.transforms.defaults.frame_classification.StandardizeSpectCollate(standardizer)
+
+        samples = [
+            (
+                torch.rand(1, n_freqs, window_size),
+                torch.randint(0, 3, (window_size,)),
+            )
+            for _ in range(batch_size)
+        ]
+        frames, frame_labels = collate_fn(samples)
+
+        expected_frames = torch.stack(
+            [standardizer(sample_frames) for sample_frames, _ in samples]
+        )
+        assert frames.shape == (batch_size, 1, n_freqs, window_size)
+        assert torch.allclose(frames, expected_frames)
+        assert torch.equal(
+            frame_labels, torch.stack([sample_labels for _, sample_labels in samples])
+        )
+
+    def test_invalid_spect_standardizer_raises(self):
+        with pytest.raises(TypeError):
+            vak.transforms.defaults.frame_classification.StandardizeSpectCollate(
+                spect_standardizer=np.zeros(5)
+            )